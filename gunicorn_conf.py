@@ -0,0 +1,12 @@
+# Gunicorn settings, used when app.py is run directly:
+#   gunicorn -c gunicorn_conf.py app:app
+import os
+
+bind = os.getenv('BIND', '0.0.0.0:5000')
+
+# gevent multiplexes the long-lived progress streams and file downloads onto
+# greenlets. Download progress lives in process memory, so a single worker
+# has to serve every request for a download.
+worker_class = 'gevent'
+workers = 1
+worker_connections = 1000